@@ -1,5 +1,6 @@
 """Commands module."""
-from typing import Dict, List, Type
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping, Type
 
 from .base import Command, CommandWithHandling, SetCommand
 from .battery import GetBattery
@@ -57,11 +58,13 @@ _COMMANDS: List[Type[CommandWithHandling]] = [
 ]
 # fmt: on
 
-COMMANDS: Dict[str, Type[CommandWithHandling]] = {cmd.name: cmd for cmd in _COMMANDS}
+COMMANDS: Mapping[str, Type[CommandWithHandling]] = MappingProxyType(
+    {cmd.name: cmd for cmd in _COMMANDS}
+)
 
-SET_COMMAND_NAMES: List[str] = [
+SET_COMMAND_NAMES: FrozenSet[str] = frozenset(
     cmd.name for cmd in COMMANDS.values() if issubclass(cmd, SetCommand)
-]
+)
 
 MAP_COMMANDS: List[Type[Command]] = [
     GetMajorMap,
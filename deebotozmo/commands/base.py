@@ -1,8 +1,19 @@
 """Base commands."""
+import functools
 import logging
 from abc import ABC, abstractmethod
 from enum import IntEnum, unique
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from  event_emitter import VacuumEmitter
 
@@ -31,6 +42,17 @@ class Command(ABC):
         """Command additional arguments."""
         return self._args
 
+    def __eq__(self, obj: object) -> bool:
+        """Return True if name and args of both commands are equal."""
+        if isinstance(obj, Command):
+            return self.name == obj.name and self._args == obj._args
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Return hash of the command name."""
+        return hash(self.name)
+
 
 class CommandWithHandling(Command, ABC):
     """Command, which handle response by itself."""
@@ -143,7 +165,7 @@ class SetCommand(_ExecuteCommand, ABC):
     def __init__(
         self,
         args: Union[Dict, List, None],
-        remove_from_kwargs: List[str],
+        remove_from_kwargs: Sequence[str],
         **kwargs: Mapping[str, Any],
     ) -> None:
         if remove_from_kwargs:
@@ -174,20 +196,23 @@ class DisplayNameIntEnum(IntEnum):
 
     def __init__(self, _: int, display_name: Optional[str] = None):
         super().__init__()
-        self._display_name = display_name
+        # name is already assigned, when the member is initialized
+        self._display_name: str = display_name or self.name.lower()
 
     @property
     def display_name(self) -> str:
         """Return the custom display name or the lowered name property."""
-        if self._display_name:
-            return self._display_name
-
-        return self.name.lower()
+        return self._display_name
 
     @classmethod
     def get(cls, value: str) -> "DisplayNameIntEnum":
         """Get enum member from name or display_name."""
-        value = str(value).upper()
+        return cls._get(str(value).upper())
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get(cls, value: str) -> "DisplayNameIntEnum":
+        """Get enum member from the upper cased name or display_name."""
         if value in cls.__members__:
             return cls[value]
 
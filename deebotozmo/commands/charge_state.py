@@ -1,12 +1,19 @@
 """Charge state commands."""
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Final, Mapping, Optional
 
 from events import StatusEvent
 from models import VacuumState
 from .base import _CODE, VacuumEmitter, _NoArgsCommand
 
 _LOGGER = logging.getLogger(__name__)
+_DOCKED_STATUS: Final = StatusEvent(True, VacuumState.DOCKED)
+_ERROR_STATUS: Final = StatusEvent(True, VacuumState.ERROR)
+_FAIL_CODE_TO_STATUS: Final[Mapping[str, StatusEvent]] = {
+    "30007": _DOCKED_STATUS,  # Already charging
+    "5": _ERROR_STATUS,  # Busy with another command
+    "3": _ERROR_STATUS,  # Bot in stuck state, example dust bin out
+}
 
 
 class GetChargeState(_NoArgsCommand):
@@ -23,7 +30,7 @@ class GetChargeState(_NoArgsCommand):
         :return: True if data was valid and no error was included
         """
         if data.get("isCharging") == 1:
-            events.status.notify(StatusEvent(True, VacuumState.DOCKED))
+            events.status.notify(_DOCKED_STATUS)
         return True
 
     @classmethod
@@ -31,17 +38,12 @@ class GetChargeState(_NoArgsCommand):
         if _CODE not in body or body[_CODE] == 0:
             return cls._handle_body_data_dict(events, body.get("data", body))
 
-        status: Optional[VacuumState] = None
+        status: Optional[StatusEvent] = None
         if body.get("msg", None) == "fail":
-            if body["code"] == "30007":  # Already charging
-                status = VacuumState.DOCKED
-            elif body["code"] == "5":  # Busy with another command
-                status = VacuumState.ERROR
-            elif body["code"] == "3":  # Bot in stuck state, example dust bin out
-                status = VacuumState.ERROR
+            status = _FAIL_CODE_TO_STATUS.get(body["code"])
 
         if status:
-            events.status.notify(StatusEvent(True, VacuumState.DOCKED))
+            events.status.notify(status)
             return True
 
         return False
@@ -1,5 +1,6 @@
 """Custom command module."""
-from typing import Any, Dict, List, Union
+from types import MappingProxyType
+from typing import Any, Dict, Final, List, Mapping, Union
 
 from  event_emitter import _LOGGER, VacuumEmitter
 from  events import CustomCommandEvent
@@ -8,11 +9,15 @@ from  events import CustomCommandEvent
 class CustomCommand:
     """Custom command, used when user wants to execute a command, which is not part of this library."""
 
+    __slots__ = ("_name", "_args")
+
+    _EMPTY_ARGS: Final[Mapping[str, Any]] = MappingProxyType({})
+
     def __init__(self, name: str, args: Union[Dict, List, None] = None) -> None:
         self._name = name
-        if args is None:
-            args = {}
-        self._args = args
+        self._args: Union[Mapping[str, Any], List] = (
+            CustomCommand._EMPTY_ARGS if args is None else args
+        )
 
     @property
     def name(self) -> str:
@@ -20,7 +25,7 @@ class CustomCommand:
         return self._name
 
     @property
-    def args(self) -> Union[Dict[str, Any], List]:
+    def args(self) -> Union[Mapping[str, Any], List]:
         """Command additional arguments."""
         return self._args
 
@@ -61,4 +61,4 @@ class SetFanSpeed(SetCommand):
         if isinstance(speed, FanSpeedLevel):
             speed = speed.value
 
-        super().__init__({"speed": speed}, [], **kwargs)
+        super().__init__({"speed": speed}, (), **kwargs)
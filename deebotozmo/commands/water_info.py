@@ -1,12 +1,15 @@
 """Water info commands."""
 import logging
-from typing import Any, Dict, Mapping, Union
+from typing import Any, Dict, Final, Mapping, Union
 
 from events import WaterInfoEvent
 from .base import DisplayNameIntEnum, SetCommand, VacuumEmitter, _NoArgsCommand
 
 _LOGGER = logging.getLogger(__name__)
 
+# removing "enable" as we don't can set it
+_REMOVE_FROM_KWARGS: Final = ("enable",)
+
 
 class WaterLevel(DisplayNameIntEnum):
     """Enum class for all possible water levels."""
@@ -55,11 +58,9 @@ class SetWaterInfo(SetCommand):
     def __init__(
         self, amount: Union[str, int, WaterLevel], **kwargs: Mapping[str, Any]
     ) -> None:
-        # removing "enable" as we don't can set it
-        remove_from_kwargs = ["enable"]
         if isinstance(amount, str):
             amount = WaterLevel.get(amount)
         if isinstance(amount, WaterLevel):
             amount = amount.value
 
-        super().__init__({"amount": amount, "enable": 0}, remove_from_kwargs, **kwargs)
+        super().__init__({"amount": amount, "enable": 0}, _REMOVE_FROM_KWARGS, **kwargs)
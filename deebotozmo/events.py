@@ -85,7 +85,7 @@ class StatsEvent:
     start: Optional[int]
 
 
-@dataclass
+@dataclass(frozen=True)
 class StatusEvent:
     """Status event representation."""
 
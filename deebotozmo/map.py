@@ -27,6 +27,7 @@ from  util import get_refresh_function
 
 _LOGGER = logging.getLogger(__name__)
 _TRACE_MAP = "trace_map"
+_DRAWABLE_PIXEL_TYPES: Final = frozenset({0x01, 0x02, 0x03})
 _ROOM_INT_TO_NAME = {
     0: "Default",
     1: "Living Room",
@@ -124,11 +125,11 @@ class Map:
         self.events: Final = MapEmitter(
             map=EventEmitter[MapEvent](
                 get_refresh_function(
-                    [GetMapTrace(), GetPos(), GetMajorMap()], execute_command
+                    (GetMapTrace(), GetPos(), GetMajorMap()), execute_command
                 ),
             ),
             rooms=EventEmitter[RoomsEvent](
-                get_refresh_function([GetCachedMapInfo()], execute_command)
+                get_refresh_function((GetCachedMapInfo(),), execute_command)
             ),
         )
 
@@ -151,13 +152,13 @@ class Map:
 
             message = message.get("resp", message)
 
-        body = message.get("body", {})
+        body = message.get("body")
 
         if not body:
             _LOGGER.warning("Invalid Event %s: %s", command_name, message)
             return
 
-        data = body.get("data", {})
+        data = body.get("data") or {}
 
         if command_name == GetCachedMapInfo.name:
             await self._handle_cached_map_info(data, requested)
@@ -373,7 +374,7 @@ class Map:
                                 point_y,
                             )
                             raise RuntimeError("Map Limit reached!")
-                        if pixel_type in [0x01, 0x02, 0x03]:
+                        if pixel_type in _DRAWABLE_PIXEL_TYPES:
                             draw.point((point_x, point_y), fill=Map.COLORS[pixel_type])
 
     def get_base64_map(self, width: Optional[int] = None) -> bytes:
@@ -0,0 +1,49 @@
+"""Shared aiohttp session module."""
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+_SHARED_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """Return the process wide session, which should be passed to all bots.
+
+    The connection pool of the session is shared between all bots, so keep-alive
+    connections, the dns cache and tls handshakes are reused.
+    Must be called from within a running event loop. Await close_shared_session()
+    before that event loop ends, as the session cannot be used by another loop.
+    """
+    global _SHARED_SESSION, _SHARED_SESSION_LOOP  # pylint: disable=global-statement
+    loop = asyncio.get_running_loop()
+    if (
+        _SHARED_SESSION is not None
+        and not _SHARED_SESSION.closed
+        and _SHARED_SESSION_LOOP is not loop
+    ):
+        raise RuntimeError(
+            "Shared session belongs to another event loop. "
+            "Await close_shared_session() before that event loop ends."
+        )
+
+    if _SHARED_SESSION is None or _SHARED_SESSION.closed:
+        # All bots talk to the same portal host, so the connections are not
+        # limited here. VacuumBot limits the concurrent commands per bot.
+        _SHARED_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=0, ttl_dns_cache=300, keepalive_timeout=75
+            )
+        )
+        _SHARED_SESSION_LOOP = loop
+    return _SHARED_SESSION
+
+
+async def close_shared_session() -> None:
+    """Close the process wide session."""
+    global _SHARED_SESSION, _SHARED_SESSION_LOOP  # pylint: disable=global-statement
+    if _SHARED_SESSION is not None:
+        await _SHARED_SESSION.close()
+        _SHARED_SESSION = None
+        _SHARED_SESSION_LOOP = None
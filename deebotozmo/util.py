@@ -3,10 +3,20 @@ import asyncio
 import copy
 import hashlib
 import os
-from typing import Awaitable, Callable, List, Union
+from typing import Awaitable, Callable, Final, Sequence, Union
 
 from  commands import Command
 
+_SANITIZE_KEYS: Final = (
+    "auth",
+    "token",
+    "userId",
+    "userid",
+    "accessToken",
+    "uid",
+    "toId",
+)
+
 
 def str_to_bool_or_cert(string: Union[bool, str]) -> Union[bool, str]:
     """Convert string to bool or certificate."""
@@ -32,7 +42,7 @@ def md5(text: str) -> str:
 
 
 def get_refresh_function(
-    commands: List[Command],
+    commands: Sequence[Command],
     execute_command: Callable[[Command], Awaitable[None]],
 ) -> Callable[[], Awaitable[None]]:
     """Return refresh function for given commands."""
@@ -56,7 +66,7 @@ def get_refresh_function(
 def sanitize_data(data: dict) -> dict:
     """Sanitize data (remove personal data)."""
     sanitized_data = copy.deepcopy(data)
-    for key in ["auth", "token", "userId", "userid", "accessToken", "uid", "toId"]:
+    for key in _SANITIZE_KEYS:
         if key in sanitized_data:
             sanitized_data[key] = "[REMOVED]"
 
@@ -1,14 +1,29 @@
 """Vacuum bot module."""
 import asyncio
-import inspect
+import functools
 import logging
 import re
-from typing import Any, Dict, Final, Optional, Union
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Final,
+    FrozenSet,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import aiohttp
 
 from  commands import (
     COMMANDS,
+    MAP_COMMANDS,
     Clean,
     Command,
     CommandWithHandling,
@@ -19,7 +34,6 @@ from  commands import (
     GetError,
     GetFanSpeed,
     GetLifeSpan,
-    GetPos,
     GetStats,
     GetWaterInfo,
 )
@@ -45,12 +59,55 @@ from  util import get_refresh_function
 
 _LOGGER = logging.getLogger(__name__)
 
-_COMMAND_REPLACE_PATTERN = "^((on)|(off)|(report))"
+_COMMAND_REPLACE_RE: Final = re.compile("^((on)|(off)|(report))")
 _COMMAND_REPLACE_REPLACEMENT = "get"
+_COMMAND_V2_SUFFIX = "_V2"
+# name is a class property, which mypy types as a callable
+_MAP_COMMAND_NAMES: Final[FrozenSet[str]] = frozenset(
+    cast(str, cmd.name) for cmd in MAP_COMMANDS
+)
+_CLEAN_RESUME: Final = Clean(CleanAction.RESUME)
+_CLEAN_START: Final = Clean(CleanAction.START)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_command(
+    command_name: str,
+) -> Tuple[str, Optional[Type[CommandWithHandling]]]:
+    """Normalize the command name and return it with the matching command class."""
+    # Handle command start start with "on","off","report" the same as "get" commands
+    command_name = _COMMAND_REPLACE_RE.sub(
+        _COMMAND_REPLACE_REPLACEMENT, command_name, count=1
+    )
+
+    # T8 series and newer
+    if command_name.endswith(_COMMAND_V2_SUFFIX):
+        command_name = command_name[: -len(_COMMAND_V2_SUFFIX)]
+
+    return command_name, COMMANDS.get(command_name, None)
 
 
 class VacuumBot:
-    """Vacuum bot representation."""
+    """Vacuum bot representation.
+
+    All bots should use the same session to share its connection pool,
+    ex. the one returned by session.get_shared_session().
+    """
+
+    __slots__ = (
+        "_admit_condition",
+        "_in_flight",
+        "_max_in_flight",
+        "_session",
+        "_status",
+        "vacuum",
+        "json",
+        "fw_version",
+        "map",
+        "events",
+        "_refreshable_emitters",
+        "_notify_status",
+    )
 
     def __init__(
         self,
@@ -62,7 +119,9 @@ class VacuumBot:
         country: str,
         verify_ssl: Union[bool, str] = True,
     ):
-        self._semaphore = asyncio.Semaphore(3)
+        self._admit_condition = asyncio.Condition()
+        self._in_flight = 0
+        self._max_in_flight = 3
         self._session = session
         self._status: StatusEvent = StatusEvent(vacuum.status == 1, None)
         self.vacuum: Final[Vacuum] = vacuum
@@ -78,50 +137,51 @@ class VacuumBot:
 
         self.map: Final = Map(self.execute_command)
 
+        execute_command = self.execute_command
+
+        def refresh_function(*commands: Command) -> Callable[[], Awaitable[None]]:
+            return get_refresh_function(commands, execute_command)
+
         status_ = EventEmitter[StatusEvent](
-            get_refresh_function(
-                [GetChargeState(), GetCleanInfo()],
-                self.execute_command,
-            )
+            refresh_function(GetChargeState(), GetCleanInfo())
         )
         self.events: Final = VacuumEmitter(
-            battery=EventEmitter[BatteryEvent](
-                get_refresh_function([GetBattery()], self.execute_command)
-            ),
-            clean_logs=EventEmitter[CleanLogEvent](
-                get_refresh_function([GetCleanLogs()], self.execute_command)
-            ),
-            error=EventEmitter[ErrorEvent](
-                get_refresh_function([GetError()], self.execute_command)
-            ),
-            fan_speed=EventEmitter[FanSpeedEvent](
-                get_refresh_function([GetFanSpeed()], self.execute_command)
-            ),
+            battery=EventEmitter[BatteryEvent](refresh_function(GetBattery())),
+            clean_logs=EventEmitter[CleanLogEvent](refresh_function(GetCleanLogs())),
+            error=EventEmitter[ErrorEvent](refresh_function(GetError())),
+            fan_speed=EventEmitter[FanSpeedEvent](refresh_function(GetFanSpeed())),
             lifespan=PollingEventEmitter[LifeSpanEvent](
-                60, get_refresh_function([GetLifeSpan()], self.execute_command), status_
+                60, refresh_function(GetLifeSpan()), status_
             ),
             map=self.map.events.map,
             rooms=self.map.events.rooms,
-            stats=EventEmitter[StatsEvent](
-                get_refresh_function([GetStats()], self.execute_command)
-            ),
+            stats=EventEmitter[StatsEvent](refresh_function(GetStats())),
             status=status_,
-            water_info=EventEmitter[WaterInfoEvent](
-                get_refresh_function([GetWaterInfo()], self.execute_command)
-            ),
+            water_info=EventEmitter[WaterInfoEvent](refresh_function(GetWaterInfo())),
             custom_command=EventEmitter[CustomCommandEvent](),
         )
 
+        self._refreshable_emitters: Final[Tuple[EventEmitter, ...]] = (
+            self.events.battery,
+            self.events.clean_logs,
+            self.events.error,
+            self.events.fan_speed,
+            self.events.lifespan,
+            self.events.map,
+            self.events.rooms,
+            self.events.stats,
+            self.events.water_info,
+        )
+
+        self._notify_status: Final = self.events.status.notify
+
         async def on_status(event: StatusEvent) -> None:
             last_status = self._status
             self._status = event
             if (not last_status.available) and event.available:
                 # bot was unavailable
-                for name, obj in inspect.getmembers(
-                    self.events, lambda obj: isinstance(obj, EventEmitter)
-                ):
-                    if name != "status":
-                        obj.request_refresh()
+                for emitter in self._refreshable_emitters:
+                    emitter.request_refresh()
             elif (
                 last_status.state != VacuumState.DOCKED
                 and event.state == VacuumState.DOCKED
@@ -132,79 +192,87 @@ class VacuumBot:
 
     async def execute_command(self, command: Union[Command, CustomCommand]) -> None:
         """Execute given command and handle response."""
-        if (
-            command == Clean(CleanAction.RESUME)
-            and self._status.state != VacuumState.PAUSED
-        ):
-            command = Clean(CleanAction.START)
-        elif (
-            command == Clean(CleanAction.START)
-            and self._status.state == VacuumState.PAUSED
-        ):
-            command = Clean(CleanAction.RESUME)
-
-        async with self._semaphore:
+        if command == _CLEAN_RESUME and self._status.state != VacuumState.PAUSED:
+            command = _CLEAN_START
+        elif command == _CLEAN_START and self._status.state == VacuumState.PAUSED:
+            command = _CLEAN_RESUME
+
+        async with self._admit():
             response = await self.json.send_command(command, self.vacuum)
 
-        await self.handle(command, response)
+        _LOGGER.debug("Handle %s: %s", command.name, response)
+        if isinstance(command, (CommandWithHandling, CustomCommand)):
+            command.handle_requested(self.events, response)
+        elif command.name in _MAP_COMMAND_NAMES:
+            await self.map.handle(command.name, response)
+        else:
+            _LOGGER.debug('Unknown command "%s" with %s', command.name, response)
+
+    @asynccontextmanager
+    async def _admit(self) -> AsyncIterator[None]:
+        """Wait until less than max_in_flight commands are running."""
+        async with self._admit_condition:
+            await self._admit_condition.wait_for(
+                lambda: self._in_flight < self._max_in_flight
+            )
+            self._in_flight += 1
+
+        try:
+            yield
+        finally:
+            # decrement before awaiting the lock, so a cancellation cannot leak the slot
+            self._in_flight -= 1
+            await asyncio.shield(self._notify_admit())
+
+    async def _notify_admit(self) -> None:
+        async with self._admit_condition:
+            self._admit_condition.notify_all()
+
+    @property
+    def max_in_flight(self) -> int:
+        """Return the maximum number of concurrently executed commands."""
+        return self._max_in_flight
+
+    async def set_max_in_flight(self, value: int) -> None:
+        """Set the maximum number of concurrently executed commands."""
+        if value < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {value}")
+
+        raised = value > self._max_in_flight
+        self._max_in_flight = value
+        if raised:
+            await self._notify_admit()
 
     def set_available(self, available: bool) -> None:
         """Set available."""
         status = StatusEvent(available, self._status.state)
-        self.events.status.notify(status)
+        self._notify_status(status)
 
     def _set_state(self, state: VacuumState) -> None:
-        self.events.status.notify(StatusEvent(True, state))
+        self._notify_status(StatusEvent(True, state))
 
     # ---------------------------- EVENT HANDLING ----------------------------
 
-    async def handle(
-        self, command: Union[str, Command, CustomCommand], message: Dict[str, Any]
-    ) -> None:
+    async def handle(self, command_name: str, message: Dict[str, Any]) -> None:
         """Handle the given event.
 
-        :param command: command object if manual request or command name
+        Responses of manual requested commands are handled in execute_command.
+
+        :param command_name: the name of the event
         :param message: the message (data) of it
         :return: None
         """
-
-        if isinstance(command, (CommandWithHandling, CustomCommand)):
-            _LOGGER.debug("Handle %s: %s", command.name, message)
-            command.handle_requested(self.events, message)
-        else:
-            if isinstance(command, str):
-                command_name = command
-            else:
-                command_name = command.name
-
-            _LOGGER.debug("Handle %s: %s", command_name, message)
-            fw_version = message.get("header", {}).get("fwVer", None)
+        _LOGGER.debug("Handle %s: %s", command_name, message)
+        header = message.get("header")
+        if header:
+            fw_version = header.get("fwVer", None)
             if fw_version:
                 self.fw_version = fw_version
 
-            # Handle command start start with "on","off","report" the same as "get" commands
-            command_name = re.sub(
-                _COMMAND_REPLACE_PATTERN,
-                _COMMAND_REPLACE_REPLACEMENT,
-                command_name,
-            )
-
-            # T8 series and newer
-            if command_name.endswith("_V2"):
-                command_name = command_name[:-3]
-
-            found_command = COMMANDS.get(command_name, None)
-            if found_command:
-                found_command.handle(self.events, message)
-            else:
-                if command_name in COMMANDS.keys():
-                    raise RuntimeError(
-                        "Command support new format. Should never happen! Please contact developers."
-                    )
-
-                if "Map" in command_name or command_name == GetPos.name:
-                    await self.map.handle(
-                        command_name, message, not isinstance(command, str)
-                    )
-                else:
-                    _LOGGER.debug('Unknown command "%s" with %s', command_name, message)
+        command_name, found_command = _resolve_command(command_name)
+        if found_command:
+            found_command.handle(self.events, message)
+        elif command_name in _MAP_COMMAND_NAMES:
+            await self.map.handle(command_name, message, False)
+        else:
+            _LOGGER.debug('Unknown command "%s" with %s', command_name, message)
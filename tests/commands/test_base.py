@@ -0,0 +1,20 @@
+from  commands import Clean, GetBattery
+from  commands.clean import CleanAction
+from  commands.custom import CustomCommand
+
+
+def test_Command_equal():
+    assert Clean(CleanAction.START) == Clean(CleanAction.START)
+    assert hash(Clean(CleanAction.START)) == hash(Clean(CleanAction.START))
+    assert GetBattery() == GetBattery()
+
+
+def test_Command_not_equal_args():
+    assert Clean(CleanAction.START) != Clean(CleanAction.RESUME)
+
+
+def test_Command_not_equal_non_command():
+    assert Clean(CleanAction.START) != "clean"
+    assert Clean(CleanAction.START) != CustomCommand(
+        Clean.name, {"act": "start", "type": "auto"}
+    )
@@ -0,0 +1,41 @@
+from unittest.mock import Mock
+
+import pytest
+
+from  commands import GetChargeState
+from  events import StatusEvent
+from  models import VacuumState
+
+
+@pytest.mark.parametrize(
+    "code, state",
+    [
+        ("30007", VacuumState.DOCKED),
+        ("5", VacuumState.ERROR),
+        ("3", VacuumState.ERROR),
+    ],
+)
+def test_GetChargeState_fail_code(code: str, state: VacuumState):
+    events = Mock()
+    body = {"code": code, "msg": "fail"}
+
+    assert GetChargeState.handle(events, {"body": body})
+    events.status.notify.assert_called_once_with(StatusEvent(True, state))
+
+
+def test_GetChargeState_unknown_fail_code():
+    events = Mock()
+    body = {"code": "1", "msg": "fail"}
+
+    assert not GetChargeState.handle(events, {"body": body})
+    events.status.notify.assert_not_called()
+
+
+def test_GetChargeState_is_charging():
+    events = Mock()
+    body = {"code": 0, "data": {"isCharging": 1}}
+
+    assert GetChargeState.handle(events, {"body": body})
+    events.status.notify.assert_called_once_with(
+        StatusEvent(True, VacuumState.DOCKED)
+    )
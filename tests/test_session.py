@@ -0,0 +1,66 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from  session import close_shared_session, get_shared_session
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    return get_shared_session()
+
+
+def test_get_shared_session_reuse():
+    async def run() -> None:
+        session = get_shared_session()
+        assert isinstance(session, aiohttp.ClientSession)
+        assert get_shared_session() is session
+        await close_shared_session()
+
+    asyncio.run(run())
+
+
+def test_get_shared_session_recreate_after_close():
+    async def run() -> None:
+        session = get_shared_session()
+        await close_shared_session()
+        assert session.closed
+
+        new_session = get_shared_session()
+        assert new_session is not session
+        assert not new_session.closed
+        await close_shared_session()
+
+    asyncio.run(run())
+
+
+def test_get_shared_session_recreate_on_other_loop():
+    async def get_and_close() -> aiohttp.ClientSession:
+        session = get_shared_session()
+        await close_shared_session()
+        return session
+
+    session = asyncio.run(get_and_close())
+
+    async def run() -> None:
+        new_session = get_shared_session()
+        assert new_session is not session
+        assert get_shared_session() is new_session
+        await close_shared_session()
+
+    asyncio.run(run())
+
+
+def test_get_shared_session_open_on_other_loop():
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_get_session())
+
+        async def run() -> None:
+            with pytest.raises(RuntimeError):
+                get_shared_session()
+
+        asyncio.run(run())
+    finally:
+        loop.run_until_complete(close_shared_session())
+        loop.close()
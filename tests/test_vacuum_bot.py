@@ -0,0 +1,161 @@
+import asyncio
+from typing import Any, List, Optional
+
+import pytest
+
+from  commands import Clean, Command, GetBattery
+from  commands.clean import CleanAction
+from  events import StatusEvent
+from  models import RequestAuth, Vacuum, VacuumState
+from  vacuum_bot import VacuumBot
+
+
+class _FakeJSON:
+    def __init__(self) -> None:
+        self.sent: List[Command] = []
+
+    async def send_command(self, command: Command, _: Vacuum) -> dict:
+        self.sent.append(command)
+        return {}
+
+
+async def _wait_until_settled() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def _create_bot() -> VacuumBot:
+    auth = RequestAuth("user_id", "realm", "token", "resource")
+    vacuum = Vacuum({"did": "did", "status": 1})
+    bot = VacuumBot(None, auth, vacuum, continent="eu", country="de")  # type: ignore
+    # let the initial status refresh finish
+    bot.json = _FakeJSON()  # type: ignore
+    await _wait_until_settled()
+    return bot
+
+
+def _execute(state: Optional[VacuumState], command: Command) -> Any:
+    async def run() -> Any:
+        bot = await _create_bot()
+        bot._status = StatusEvent(True, state)
+        bot.json = _FakeJSON()  # type: ignore
+        await bot.execute_command(command)
+        return bot.json.sent
+
+    return asyncio.run(run())
+
+
+def test_execute_command_resume_not_paused_sends_start():
+    assert _execute(VacuumState.IDLE, Clean(CleanAction.RESUME)) == [
+        Clean(CleanAction.START)
+    ]
+
+
+def test_execute_command_resume_paused_sends_resume():
+    assert _execute(VacuumState.PAUSED, Clean(CleanAction.RESUME)) == [
+        Clean(CleanAction.RESUME)
+    ]
+
+
+def test_execute_command_start_paused_sends_resume():
+    assert _execute(VacuumState.PAUSED, Clean(CleanAction.START)) == [
+        Clean(CleanAction.RESUME)
+    ]
+
+
+def test_execute_command_start_not_paused_sends_start():
+    assert _execute(VacuumState.CLEANING, Clean(CleanAction.START)) == [
+        Clean(CleanAction.START)
+    ]
+
+
+class _BlockingJSON:
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.release = asyncio.Event()
+
+    async def send_command(self, _: Command, __: Vacuum) -> dict:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await self.release.wait()
+        finally:
+            self.running -= 1
+        return {}
+
+
+def test_execute_command_max_in_flight():
+    async def run() -> None:
+        bot = await _create_bot()
+        json = bot.json = _BlockingJSON()  # type: ignore
+        tasks = [
+            asyncio.create_task(bot.execute_command(GetBattery())) for _ in range(6)
+        ]
+        await _wait_until_settled()
+        assert json.running == bot.max_in_flight == 3
+
+        json.release.set()
+        await asyncio.gather(*tasks)
+        assert json.max_running == 3
+        assert bot._in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_execute_command_raise_max_in_flight():
+    async def run() -> None:
+        bot = await _create_bot()
+        json = bot.json = _BlockingJSON()  # type: ignore
+        tasks = [
+            asyncio.create_task(bot.execute_command(GetBattery())) for _ in range(5)
+        ]
+        await _wait_until_settled()
+        assert json.running == 3
+
+        await bot.set_max_in_flight(5)
+        await _wait_until_settled()
+        assert json.running == 5
+
+        json.release.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+
+def test_execute_command_cancel_frees_slot():
+    async def run() -> None:
+        bot = await _create_bot()
+        await bot.set_max_in_flight(1)
+        json = bot.json = _BlockingJSON()  # type: ignore
+        task = asyncio.create_task(bot.execute_command(GetBattery()))
+        await _wait_until_settled()
+        assert bot._in_flight == 1
+
+        # cancel while the condition lock is contended
+        async with bot._admit_condition:
+            task.cancel()
+            await _wait_until_settled()
+            task.cancel()
+            await _wait_until_settled()
+            assert bot._in_flight == 0
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        json.release.set()
+        await asyncio.wait_for(bot.execute_command(GetBattery()), 1)
+        assert bot._in_flight == 0
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("value", [0, -1])
+def test_set_max_in_flight_invalid(value: int):
+    async def run() -> None:
+        bot = await _create_bot()
+        with pytest.raises(ValueError):
+            await bot.set_max_in_flight(value)
+        assert bot.max_in_flight == 3
+
+    asyncio.run(run())